@@ -0,0 +1,60 @@
+# Production entry point for the API:
+#
+#     cd api && gunicorn -c gunicorn.conf.py api:app
+#
+# Each worker process holds its own SQLAlchemy pool, sized to one connection
+# per thread (SOLAR_DB_POOL_SIZE defaults to SOLAR_THREADS, no overflow), plus
+# one LISTEN connection for /stream on Postgres. The number of Postgres
+# connections is at most
+# workers * (SOLAR_DB_POOL_SIZE + SOLAR_DB_MAX_OVERFLOW + 1),
+# e.g. 17 * (4 + 0 + 1) = 85 on an 8-core host. Keep this, plus the job
+# runner's SOLAR_JOB_WORKERS connections, below Postgres max_connections
+# (100 by default); lower SOLAR_WORKERS or SOLAR_THREADS on larger hosts.
+#
+# The default memory:// response cache and its invalidation tags are per
+# process, so a write handled by one worker does not evict the others' entries,
+# and the separate flask run-worker process cannot invalidate any of them when a
+# run finishes. Set SOLAR_CACHE_URL=redis://... in production; without it the
+# cache TTL drops to SOLAR_CACHE_TTL=5 seconds, which bounds how long model
+# accuracy and metrics stay stale after a run.
+#
+# Dashboards' /stream connections are served by a separate asyncio process
+# that relays Postgres NOTIFY messages to up to
+# SOLAR_STREAM_SERVER_MAX_CONNECTIONS (10000) idle clients:
+#
+#     cd api && flask --app api run-stream    # listens on SOLAR_STREAM_BIND, :5001
+#
+# Route /stream to it in the reverse proxy with buffering disabled, e.g. nginx
+# `location /stream { proxy_pass http://127.0.0.1:5001; proxy_buffering off; }`,
+# and raise the open file limit (ulimit -n) above the connection cap. The
+# gunicorn /stream route is kept for development; since every open stream
+# occupies a gthread thread, each worker accepts at most
+# SOLAR_STREAM_MAX_CONNECTIONS of them (half of SOLAR_THREADS by default) and
+# answers further ones with 503.
+#
+# With SOLAR_INSTRUMENTATION=1 every worker keeps its own /prometheus
+# histograms, so a scrape only sees the worker that answered it. Run a single
+# worker (SOLAR_WORKERS=1) when comparing latency distributions.
+import multiprocessing
+import os
+
+bind = os.environ.get('SOLAR_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('SOLAR_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('SOLAR_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('SOLAR_THREADS', 4))
+timeout = int(os.environ.get('SOLAR_WORKER_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive = 5
+max_requests = 10000
+max_requests_jitter = 1000
+accesslog = '-'
+
+if not os.environ.get('SOLAR_CACHE_URL', '').startswith('redis'):
+    os.environ.setdefault('SOLAR_CACHE_TTL', '5')
+
+def when_ready(server):
+    if not os.environ.get('SOLAR_CACHE_URL', '').startswith('redis'):
+        server.log.warning(
+            'Response cache is per process (%d workers plus run-worker); set SOLAR_CACHE_URL to a redis:// URL '
+            'for shared invalidation (cache TTL is %ss)', workers, os.environ['SOLAR_CACHE_TTL']
+        )